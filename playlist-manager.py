@@ -1,25 +1,68 @@
 import os
+import bisect
 import json
+import hashlib
+import tempfile
 import re
 import shutil
 import random
+import threading
 from PyQt5 import QtWidgets, QtGui, QtCore
-from mutagen.id3 import ID3, COMM, ID3NoHeaderError
-from mutagen.easyid3 import EasyID3
 from collections import defaultdict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library serializer
+    orjson = None
+
+# mutagen is imported inside the functions that read or write tags, so
+# startup does not pay for loading it
 
 # Constants for JSON database
 SONGS_DATABASE = "songs.json"  # Main database with song metadata
 PLAYLISTS_DATABASE = "playlists.json"  # Database for playlist orders
 ID_PREFIX = "ID"
 
-# New constant for order pattern
+# Item role holding a row's precomputed lowercase search text
+SEARCH_ROLE = QtCore.Qt.UserRole + 1
+
+# Order prefix of a filename, e.g. '001 Song.mp3'
 ORDER_PATTERN = re.compile(r'^(\d{3})\s+(.+)$')
 
+# Parsed databases keyed by file path -> ((mtime_ns, size), data)
+_database_cache = {}
+
+# Digest of the last bytes written to each database, keyed by file path ->
+# (digest, (mtime_ns, size) after the write)
+_database_digests = {}
+
+# Writes deferred by the current thread's db_transaction, keyed by file path
+_transaction = threading.local()
+
+# Guards the database and derived caches, which background workers share
+# with the GUI thread
+_database_lock = threading.RLock()
+
+# Derived data keyed by name -> (source paths, source database objects,
+# value), rebuilt whenever one of the source databases is re-read and dropped
+# when a source database object is replaced
+_derived_cache = {}
+
+# Worker threads used for parallel tag reads and writes
+TAG_WORKERS = min(8, os.cpu_count() or 1)
+
+# Cache of metadata IDs keyed by (file path, mtime in ns, size)
+ID_METADATA_CACHE_SIZE = 10000
+_id_metadata_cache = {}
+
 def add_id_to_metadata(file_path, song_id):
     """
     Add song ID to MP3 file metadata.
     """
+    from mutagen.id3 import ID3, COMM, ID3NoHeaderError
+
     try:
         # Load the ID3 tag or create one if it doesn't exist
         try:
@@ -27,6 +70,11 @@ def add_id_to_metadata(file_path, song_id):
         except ID3NoHeaderError:
             audio = ID3()
         
+        # Nothing to write if the ID is already the only comment
+        existing = [frame.text[0] for frame in audio.getall("COMM") if frame.text]
+        if existing == [song_id]:
+            return True
+        
         # Remove existing comments and add new one
         audio.delall("COMM")
         audio.add(COMM(encoding=3, lang="eng", desc=song_id, text=song_id))
@@ -41,20 +89,75 @@ def add_id_to_metadata(file_path, song_id):
         return False
 
 
+def remove_id_from_metadata(file_path):
+    """
+    Remove the song ID comments from MP3 file metadata.
+    """
+    from mutagen.id3 import ID3
+
+    try:
+        audio = ID3(file_path)
+        audio.delall("COMM")
+        audio.save()
+    except Exception as e:
+        print(f"Error removing metadata from {file_path}: {str(e)}")
+
+
+def write_id3(job):
+    """
+    Set the title tag of an MP3 file from its filename, first tagging it
+    with a song ID when one is given. Takes a (file_path, song_id) tuple.
+    """
+    from mutagen.easyid3 import EasyID3
+    from mutagen.id3 import ID3NoHeaderError
+
+    file_path, song_id = job
+    if song_id is not None:
+        add_id_to_metadata(file_path, song_id)
+    # A missing tag is created by the same save that writes the title
+    try:
+        audio = EasyID3(file_path)
+    except ID3NoHeaderError:
+        audio = EasyID3()
+
+    # Set title without extension so it reflects the order prefix
+    audio['title'] = os.path.splitext(os.path.basename(file_path))[0]
+    audio.save(file_path)
+
+
 def get_id_from_metadata(file_path):
     """
     Retrieve song ID from MP3 file metadata.
+    Results are cached until the file's modification time or size changes.
     """
+    try:
+        stat = os.stat(file_path)
+        cache_key = (file_path, stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        cache_key = None
+    if cache_key in _id_metadata_cache:
+        return _id_metadata_cache[cache_key]
+
+    from mutagen.id3 import ID3
+
+    song_id = None
     try:
         audio = ID3(file_path)
         for key in audio.keys():
             if key.startswith("COMM"):
                 comment = audio[key].text[0]
                 if comment.startswith("ID"):  # Check if it's our ID format
-                    return comment
+                    song_id = comment
+                    break
     except Exception as e:
         print(f"Error reading metadata from {file_path}: {str(e)}")
-    return None
+
+    if cache_key is not None:
+        # Forget the oldest entry once the cache is full
+        if len(_id_metadata_cache) >= ID_METADATA_CACHE_SIZE:
+            del _id_metadata_cache[next(iter(_id_metadata_cache))]
+        _id_metadata_cache[cache_key] = song_id
+    return song_id
 
 class EditDialog(QtWidgets.QDialog):
     def __init__(self, songs, parent=None):
@@ -150,7 +253,7 @@ class EditDialog(QtWidgets.QDialog):
                     db_song["weight"] = self.weight_spin.value()
             
             save_songs_to_database(all_songs)
-            self.parentWidget().refresh_all_views()
+            self.parentWidget().schedule_refresh()
             self.parentWidget().statusBar().showMessage(f"{field.capitalize()} updated successfully")
             
         except Exception as e:
@@ -275,6 +378,27 @@ class OrderPreviewDialog(QtWidgets.QDialog):
     def get_apply_method(self):
         return "current" if self.current_dir_radio.isChecked() else "new"
 
+class WorkerSignals(QtCore.QObject):
+    """Signals used by background workers to report back to the GUI thread"""
+    finished = QtCore.pyqtSignal(str)
+    error = QtCore.pyqtSignal(str)
+    progress = QtCore.pyqtSignal(int)
+
+class DeletePlaylistWorker(QtCore.QRunnable):
+    """Delete a playlist folder and everything in it off the GUI thread"""
+    def __init__(self, folder_path):
+        super().__init__()
+        self.folder_path = folder_path
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            shutil.rmtree(self.folder_path)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(self.folder_path)
+
 class PlaylistManagerUI(QtWidgets.QMainWindow):
     def __init__(self):
         super().__init__()
@@ -282,6 +406,7 @@ class PlaylistManagerUI(QtWidgets.QMainWindow):
         self.setGeometry(100, 100, 1000, 700)
         self.current_folder = None
         self.hide_numbers = False
+        self.refresh_pending = False
         
         # Create main widget and layout
         main_widget = QtWidgets.QWidget()
@@ -351,16 +476,33 @@ class PlaylistManagerUI(QtWidgets.QMainWindow):
 
             def displayText(self, value, locale):
                 if self.parent_window.hide_numbers:
+                    # Fast path for the usual "001 Name" form, regex for the rest
+                    if (len(value) > 4 and value[3] == " " and
+                            not value[4].isspace() and value[:3].isdecimal()):
+                        return value[4:]
                     match = ORDER_PATTERN.match(value)
                     if match:
                         return match.group(2)
                 return value
 
         # Setup table with modified column behavior
-        self.table_registered = QtWidgets.QTableWidget()
-        self.table_registered.setColumnCount(6)
-        self.table_registered.setHorizontalHeaderLabels(["Order", "ID", "Name", "Path", "Series", "Weight"])
-        
+        self.registered_model = QtGui.QStandardItemModel(0, 6)
+        self.registered_model.setHorizontalHeaderLabels(["Order", "ID", "Name", "Path", "Series", "Weight"])
+        self.registered_row_items = {}  # Song ID -> items of its row, updated in place on refresh
+        self.registered_songs = {}  # Song ID -> folder song entry shown in its row
+
+        # Filtering and sorting are done by the proxy on the Qt side
+        self.registered_proxy = QtCore.QSortFilterProxyModel()
+        self.registered_proxy.setSourceModel(self.registered_model)
+        # Each row keeps its cells joined and lowercased in one search string,
+        # so the filter checks one value per row instead of six
+        self.registered_proxy.setFilterKeyColumn(0)
+        self.registered_proxy.setFilterRole(SEARCH_ROLE)
+        self.registered_proxy.setFilterCaseSensitivity(QtCore.Qt.CaseSensitive)
+
+        self.table_registered = QtWidgets.QTableView()
+        self.table_registered.setModel(self.registered_proxy)
+
         # Set individual column resize modes and default widths
         self.table_registered.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.Interactive)
         self.table_registered.horizontalHeader().setSectionResizeMode(1, QtWidgets.QHeaderView.Interactive)
@@ -379,10 +521,8 @@ class PlaylistManagerUI(QtWidgets.QMainWindow):
         
         self.table_registered.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.table_registered.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        # Order and Weight hold integers, so the proxy sorts them numerically
         self.table_registered.setSortingEnabled(True)
-        
-        # Connect sorting signal
-        self.table_registered.horizontalHeader().sortIndicatorChanged.connect(self.on_sort_changed)
         layout.addWidget(self.table_registered)
         
         # [Rest of the setup_registered_tab remains the same]
@@ -454,130 +594,153 @@ class PlaylistManagerUI(QtWidgets.QMainWindow):
         self.tab_order.refresh_view()
         self.tab_disabled.refresh_view()  # Add refresh for disabled tab
 
+    def schedule_refresh(self):
+        """Refresh all views shortly, coalescing bursts of requests into one reload"""
+        if not self.refresh_pending:
+            self.refresh_pending = True
+            QtCore.QTimer.singleShot(50, self.run_scheduled_refresh)
+
+    def run_scheduled_refresh(self):
+        self.refresh_pending = False
+        self.refresh_all_views()
+
     def handle_sort(self, logical_index):
         if logical_index == 2:  # Name column
-            self.table_registered.sortItems(2, QtCore.Qt.AscendingOrder if self.table_registered.horizontalHeader().sortIndicatorOrder() == QtCore.Qt.DescendingOrder else QtCore.Qt.DescendingOrder)
+            self.table_registered.sortByColumn(2, QtCore.Qt.AscendingOrder if self.table_registered.horizontalHeader().sortIndicatorOrder() == QtCore.Qt.DescendingOrder else QtCore.Qt.DescendingOrder)
             self.refresh_all_views()
 
-    def on_sort_changed(self, logical_index, order):
-        """Handle sorting of columns"""
-        self.load_registered_songs()
-
     def load_registered_songs(self):
         if not self.current_folder:
             return
 
         current_scroll = self.table_registered.verticalScrollBar().value()
-        search_text = self.filter_input.text().lower()  # Changed from search_bar to filter_input
-
-        # Temporarily disable sorting to prevent recursion
-        self.table_registered.setSortingEnabled(False)
-
-        # Clear the table
-        self.table_registered.setRowCount(0)
 
-        # Load songs with their order information
+        # Load songs with their order information; rows are sorted by the proxy
         folder_songs = load_folder_songs(self.current_folder)
+        self.registered_songs = {song["id"]: song for song in folder_songs}
 
-        # Apply search filter if search text exists
-        if search_text:
-            folder_songs = [
-                song for song in folder_songs
-                if search_text in song["name"].lower() or
-                search_text in song["series"].lower() or
-                search_text in song["id"].lower()
-            ]
+        model = self.registered_model
+        row_items = self.registered_row_items
+        folder_ids = {song["id"] for song in folder_songs}
+        self.table_registered.setUpdatesEnabled(False)
 
-        # Get current sort column and order
-        header = self.table_registered.horizontalHeader()
-        sort_column = header.sortIndicatorSection()
-        sort_order = header.sortIndicatorOrder()
-
-        # Sort the songs list based on the current sort column
-        if sort_column == 0:  # Order
-            folder_songs.sort(key=lambda x: x.get("order", 0), reverse=(sort_order == QtCore.Qt.DescendingOrder))
-        elif sort_column == 1:  # ID
-            folder_songs.sort(key=lambda x: x["id"], reverse=(sort_order == QtCore.Qt.DescendingOrder))
-        elif sort_column == 2:  # Name
-            folder_songs.sort(key=lambda x: x["name"], reverse=(sort_order == QtCore.Qt.DescendingOrder))
-        elif sort_column == 3:  # Path
-            folder_songs.sort(key=lambda x: x["path"], reverse=(sort_order == QtCore.Qt.DescendingOrder))
-        elif sort_column == 4:  # Series
-            folder_songs.sort(key=lambda x: x["series"], reverse=(sort_order == QtCore.Qt.DescendingOrder))
-        elif sort_column == 5:  # Weight
-            folder_songs.sort(key=lambda x: x["weight"], reverse=(sort_order == QtCore.Qt.DescendingOrder))
-
-        # Populate the table
-        for row, song in enumerate(folder_songs):
-            self.table_registered.insertRow(row)
-
-            # Create and set items
-            order_item = QtWidgets.QTableWidgetItem()
-            order_item.setData(QtCore.Qt.DisplayRole, int(song.get("order", 0)))
-
-            id_item = QtWidgets.QTableWidgetItem(song["id"])
-            name_item = QtWidgets.QTableWidgetItem(song["name"])
-            path_item = QtWidgets.QTableWidgetItem(song["path"])
-            series_item = QtWidgets.QTableWidgetItem(song["series"])
-
-            weight_item = QtWidgets.QTableWidgetItem()
-            weight_item.setData(QtCore.Qt.DisplayRole, int(song["weight"]))
-
-            # Set items
-            self.table_registered.setItem(row, 0, order_item)
-            self.table_registered.setItem(row, 1, id_item)
-            self.table_registered.setItem(row, 2, name_item)
-            self.table_registered.setItem(row, 3, path_item)
-            self.table_registered.setItem(row, 4, series_item)
-            self.table_registered.setItem(row, 5, weight_item)
-
-        # Re-enable sorting
-        self.table_registered.setSortingEnabled(True)
+        # Drop the rows of songs that are no longer in the folder
+        stale_ids = [song_id for song_id in row_items if song_id not in folder_ids]
+        if len(stale_ids) == len(row_items):
+            model.setRowCount(0)
+        else:
+            # Remove runs of adjacent rows together, bottom-up so rows stay valid
+            stale_rows = sorted(row_items[song_id][0].row() for song_id in stale_ids)
+            runs = []
+            for row in stale_rows:
+                if runs and runs[-1][0] + runs[-1][1] == row:
+                    runs[-1][1] += 1
+                else:
+                    runs.append([row, 1])
+            for first, count in reversed(runs):
+                model.removeRows(first, count)
+        for song_id in stale_ids:
+            del row_items[song_id]
+
+        # Update existing rows in place, only touching cells whose value changed
+        new_songs = []
+        for song in folder_songs:
+            items = row_items.get(song["id"])
+            if items is None:
+                new_songs.append(song)
+                continue
+            values = self.registered_row_values(song)
+            changed = False
+            for item, value in zip(items, values):
+                if item.data(QtCore.Qt.DisplayRole) != value:
+                    item.setData(value, QtCore.Qt.DisplayRole)
+                    changed = True
+            if changed:
+                items[0].setData(self.registered_search_text(values), SEARCH_ROLE)
+
+        # Append the new rows in one batch: size the model once, fill it with
+        # its signals blocked and then announce all the rows together
+        first_row = model.rowCount()
+        model.setRowCount(first_row + len(new_songs))
+        model.blockSignals(True)
+        for row, song in enumerate(new_songs, first_row):
+            values = self.registered_row_values(song)
+            items = []
+            for column, value in enumerate(values):
+                item = QtGui.QStandardItem()
+                item.setData(value, QtCore.Qt.DisplayRole)
+                model.setItem(row, column, item)
+                items.append(item)
+            items[0].setData(self.registered_search_text(values), SEARCH_ROLE)
+            row_items[song["id"]] = items
+        model.blockSignals(False)
+
+        if new_songs:
+            model.dataChanged.emit(
+                model.index(first_row, 0),
+                model.index(model.rowCount() - 1, model.columnCount() - 1)
+            )
+        self.table_registered.setUpdatesEnabled(True)
 
         # Restore scroll position
         self.table_registered.verticalScrollBar().setValue(current_scroll)
 
+    def registered_row_values(self, song):
+        """Return the cell values of a song's row in the registered table"""
+        return [
+            int(song.get("order", 0)),
+            song["id"],
+            song["name"],
+            song["path"],
+            song["series"],
+            int(song["weight"]),
+        ]
+
+    def registered_search_text(self, values):
+        """Join a row's cell values into the lowercase string the filter searches"""
+        # Newlines cannot be typed in the filter box, so matches never span cells
+        return "\n".join(str(value) for value in values).lower()
+
     def load_unregistered_songs(self):
         if not self.current_folder:
             return
             
+        registered_paths = get_registered_paths()
+        
+        # DirEntry.path already joins the folder and the filename
+        new_items = []
+        with os.scandir(self.current_folder) as entries:
+            for entry in entries:
+                filename = entry.name
+                if filename.lower().endswith('.mp3') and entry.path not in registered_paths:
+                    new_items.append(filename)
+
+        # Add all items at once instead of one layout pass per item
+        self.list_unregistered.setUpdatesEnabled(False)
         self.list_unregistered.clear()
-        registered_paths = {song["path"] for song in load_songs_from_database()}
-        
-        for filename in os.listdir(self.current_folder):
-            if filename.lower().endswith('.mp3'):
-                file_path = os.path.join(self.current_folder, filename)
-                if file_path not in registered_paths:
-                    self.list_unregistered.addItem(filename)
+        self.list_unregistered.addItems(new_items)
+        self.list_unregistered.setUpdatesEnabled(True)
 
     def filter_registered_songs(self):
-        filter_text = self.filter_input.text().lower()
-        for row in range(self.table_registered.rowCount()):
-            hidden = True
-            for col in range(self.table_registered.columnCount()):
-                item = self.table_registered.item(row, col)
-                if item and filter_text in item.text().lower():
-                    hidden = False
-                    break
-            self.table_registered.setRowHidden(row, hidden)
-        self.load_registered_songs()
+        self.registered_proxy.setFilterFixedString(self.filter_input.text().lower())
 
-    def edit_selected_songs(self):
-        selected_rows = sorted(set(item.row() for item in self.table_registered.selectedItems()))
-        if not selected_rows:
-            return
+    def selected_registered_rows(self):
+        """Return the source model rows of the selected registered songs"""
+        return sorted(
+            self.registered_proxy.mapToSource(index).row()
+            for index in self.table_registered.selectionModel().selectedRows()
+        )
 
-        # Get selected songs data
-        songs_to_edit = []
-        for row in selected_rows:
-            song_id = self.table_registered.item(row, 1).text()
-            songs = load_songs_from_database()
-            song = next((s for s in songs if s["id"] == song_id), None)
-            if song:
-                # Add order information
-                song["order"] = get_playlist_order(self.current_folder, song_id)
-                songs_to_edit.append(song)
+    def selected_registered_songs(self):
+        """Return the folder song entries of the selected registered rows"""
+        return [
+            self.registered_songs[self.registered_model.item(row, 1).text()]
+            for row in self.selected_registered_rows()
+        ]
 
+    def edit_selected_songs(self):
+        # Copy the selected entries, which already carry their order
+        songs_to_edit = [dict(song) for song in self.selected_registered_songs()]
         if not songs_to_edit:
             return
 
@@ -587,6 +750,9 @@ class PlaylistManagerUI(QtWidgets.QMainWindow):
             self.apply_edits(songs_to_edit, values)
 
     def apply_edits(self, songs_to_edit, values):
+        from mutagen.easyid3 import EasyID3
+        from mutagen.id3 import ID3NoHeaderError
+
         all_songs = load_songs_from_database()
         
         try:
@@ -605,19 +771,19 @@ class PlaylistManagerUI(QtWidgets.QMainWindow):
                         db_song["path"] = new_path
                         db_song["name"] = new_filename
 
-                        # Update title metadata to match filename without extension
+                        # Update title metadata to match filename without extension,
+                        # writing the tag only once even when it has to be created
                         try:
                             audio = EasyID3(new_path)
                         except ID3NoHeaderError:
                             audio = EasyID3()
-                            audio.save(new_path)
                         
                         title_without_ext = os.path.splitext(new_filename)[0]
                         audio['title'] = title_without_ext
-                        audio.save()
+                        audio.save(new_path)
 
             save_songs_to_database(all_songs)
-            self.refresh_all_views()
+            self.schedule_refresh()
             self.statusBar().showMessage("Changes applied successfully")
 
         except Exception as e:
@@ -625,11 +791,11 @@ class PlaylistManagerUI(QtWidgets.QMainWindow):
                 self, "Error",
                 f"An error occurred while applying changes: {str(e)}"
             )
-            self.refresh_all_views()
+            self.schedule_refresh()
 
     def remove_selected_songs(self):
-        selected_rows = sorted(set(item.row() for item in self.table_registered.selectedItems()), reverse=True)
-        if not selected_rows:
+        selected_songs = self.selected_registered_songs()
+        if not selected_songs:
             return
             
         reply = QtWidgets.QMessageBox.question(
@@ -639,22 +805,17 @@ class PlaylistManagerUI(QtWidgets.QMainWindow):
         )
         
         if reply == QtWidgets.QMessageBox.Yes:
-            for row in selected_rows:
-                song_id = self.table_registered.item(row, 1).text()
-                file_path = self.table_registered.item(row, 3).text()
-                
-                try:
-                    # Remove COMM tags from the file
-                    audio = ID3(file_path)
-                    audio.delall("COMM")
-                    audio.save()
-                except Exception as e:
-                    print(f"Error removing metadata from {file_path}: {str(e)}")
-                
-                # Remove from both databases
-                remove_song_from_database(song_id, self.current_folder)
+            song_ids = [song["id"] for song in selected_songs]
+            file_paths = [song["path"] for song in selected_songs]
 
-            self.refresh_all_views()
+            # Remove COMM tags from the files in parallel
+            with ThreadPoolExecutor(max_workers=TAG_WORKERS) as executor:
+                list(executor.map(remove_id_from_metadata, file_paths))
+
+            # Remove from both databases in a single pass
+            remove_songs_from_database(song_ids, self.current_folder)
+
+            self.schedule_refresh()
             self.statusBar().showMessage("Selected songs removed successfully")
 
     def add_selected_songs(self):
@@ -663,28 +824,49 @@ class PlaylistManagerUI(QtWidgets.QMainWindow):
             return
             
         successful_adds = 0
-        for item in selected_items:
-            file_path = os.path.join(self.current_folder, item.text())
-            
-            # First check if the file has an ID in its metadata
-            existing_id = get_id_from_metadata(file_path)
-            if existing_id:
-                # Check if this ID exists in our database
-                songs = load_songs_from_database()
-                existing_song = next((song for song in songs if song["id"] == existing_id), None)
-                if existing_song:
-                    # Update the existing entry if needed
-                    existing_song["path"] = file_path
-                    existing_song["name"] = os.path.basename(file_path)
-                    save_songs_to_database(songs)
+        added_names = set()
+        # Write each database once for the whole selection
+        with db_transaction():
+            for item in selected_items:
+                file_path = os.path.join(self.current_folder, item.text())
+                
+                # First check if the file has an ID in its metadata
+                existing_id = get_id_from_metadata(file_path)
+                if existing_id:
+                    # Check if this ID exists in our database
+                    if existing_id in get_songs_by_id():
+                        # Update the existing entry if needed
+                        songs = load_songs_from_database()
+                        existing_song = next(song for song in songs if song["id"] == existing_id)
+                        existing_song["path"] = file_path
+                        existing_song["name"] = os.path.basename(file_path)
+                        save_songs_to_database(songs)
+                        successful_adds += 1
+                        added_names.add(item.text())
+                        continue
+                
+                # If no existing ID or invalid ID, create new entry
+                if add_song_to_database(file_path):
                     successful_adds += 1
-                    continue
-            
-            # If no existing ID or invalid ID, create new entry
-            if add_song_to_database(file_path):
-                successful_adds += 1
+                    added_names.add(item.text())
         
-        self.refresh_all_views()
+        # Only the views that show registered songs change: the registered
+        # table appends just the new rows, and the added files are dropped
+        # from the unregistered list without rescanning the folder. A song
+        # re-registered by its ID may have come from the Disabled folder, so
+        # that tab is refreshed too.
+        self.load_registered_songs()
+        remaining = [
+            self.list_unregistered.item(row).text()
+            for row in range(self.list_unregistered.count())
+        ]
+        remaining = [name for name in remaining if name not in added_names]
+        self.list_unregistered.setUpdatesEnabled(False)
+        self.list_unregistered.clear()
+        self.list_unregistered.addItems(remaining)
+        self.list_unregistered.setUpdatesEnabled(True)
+        self.tab_order.refresh_view()
+        self.tab_disabled.refresh_view()
         self.statusBar().showMessage(f"Added {successful_adds} songs successfully")
 
     def delete_playlist(self):
@@ -707,41 +889,400 @@ class PlaylistManagerUI(QtWidgets.QMainWindow):
         )
         
         if reply == QtWidgets.QMessageBox.Yes:
-            try:
-                # Delete all files in the folder
-                for root, dirs, files in os.walk(self.current_folder, topdown=False):
-                    for name in files:
-                        os.remove(os.path.join(root, name))
-                    for name in dirs:
-                        os.rmdir(os.path.join(root, name))
-                os.rmdir(self.current_folder)
+            # Remove the files on a worker thread so the UI stays responsive,
+            # but keep every action blocked until the worker reports back
+            self.centralWidget().setEnabled(False)
+            self.statusBar().showMessage(f"Deleting {self.current_folder}...")
+            worker = DeletePlaylistWorker(self.current_folder)
+            worker.signals.finished.connect(self.on_playlist_deleted, QtCore.Qt.QueuedConnection)
+            worker.signals.error.connect(self.on_playlist_delete_failed, QtCore.Qt.QueuedConnection)
+            QtCore.QThreadPool.globalInstance().start(worker)
+
+    def on_playlist_deleted(self, folder_path):
+        """Remove the deleted playlist's data once its files are gone"""
+        self.centralWidget().setEnabled(True)
+        try:
+            # The trailing separator keeps e.g. "rock_old" from matching "rock"
+            prefix = os.path.join(folder_path, "")
+
+            # Remove songs from songs.json
+            songs = load_songs_from_database()
+            songs[:] = [song for song in songs 
+                        if not song["path"].startswith(prefix)]
+            save_songs_to_database(songs)
+            
+            # Remove the playlist and its subfolders' playlists from playlists.json
+            playlists = load_playlists_from_database()
+            playlists[:] = [playlist for playlist in playlists 
+                            if playlist["folder_path"] != folder_path and
+                            not playlist["folder_path"].startswith(prefix)]
+            save_playlists_to_database(playlists)
+            
+            # Clear current folder and refresh UI
+            if self.current_folder == folder_path:
+                self.current_folder = None
+                self.folder_path.clear()
+            self.schedule_refresh()
+            self.statusBar().showMessage("Playlist deleted successfully")
+            
+        except Exception as e:
+            self.on_playlist_delete_failed(str(e))
+
+    def on_playlist_delete_failed(self, message):
+        self.centralWidget().setEnabled(True)
+        QtWidgets.QMessageBox.critical(
+            self,
+            "Error",
+            f"An error occurred while deleting the playlist: {message}"
+        )
+        self.schedule_refresh()
+
+class ApplyChangesWorker(QtCore.QRunnable):
+    """Apply staged order changes to the files and databases off the GUI thread"""
+    def __init__(self, current_dir, target_dir, changes, copy_to_new_dir):
+        super().__init__()
+        self.current_dir = current_dir
+        self.target_dir = target_dir
+        self.changes = changes
+        self.copy_to_new_dir = copy_to_new_dir
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            self.apply()
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(self.target_dir)
+
+    def report_progress(self, done, total):
+        self.signals.progress.emit(int(done * 100 / total) if total else 100)
+
+    def apply(self):
+        current_dir = self.current_dir
+        target_dir = self.target_dir
+        disabled_folder = os.path.join(current_dir, "Disabled")
+
+        # Load current state
+        songs = load_songs_from_database()
+        new_songs = []
+        used_ids = {s["id"] for s in songs}
+        # Lazily walk the unused IDs in order, so each copy takes the next one
+        free_ids = (
+            candidate_id
+            for candidate_id in (f"{ID_PREFIX}{i:04d}" for i in range(10000))
+            if candidate_id not in used_ids
+        )
+        
+        # Track all changes for potential rollback
+        file_operations = []  # List of (operation, old_path, new_path) tuples
+        db_changes = []  # List of (song_dict, original_state) tuples
+        new_db_entries = []  # List of new songs to be added
+        
+        # First pass: Validate all file operations are possible, listing each
+        # involved folder once instead of checking every path. Names are
+        # compared with normcase, as case-insensitive file systems would.
+        def normcase_names(folder):
+            return {os.path.normcase(name) for name in list_file_names(folder)}
+        current_names = normcase_names(current_dir)
+        disabled_names = normcase_names(disabled_folder)
+        target_names = current_names if target_dir == current_dir else normcase_names(target_dir)
+        folder_ids = {song["id"] for song in get_songs_by_dir().get(current_dir, ())}
+        for song in songs:
+            if song["id"] in folder_ids:
+                old_path = song["path"]
+                filename = os.path.basename(old_path)
                 
-                # Remove songs from songs.json
-                songs = load_songs_from_database()
-                songs = [song for song in songs 
-                        if not song["path"].startswith(self.current_folder)]
-                save_songs_to_database(songs)
+                # Skip if file doesn't exist
+                if os.path.normcase(filename) not in current_names:
+                    raise FileNotFoundError(f"Source file not found: {old_path}")
                 
-                # Remove playlist from playlists.json
-                playlists = load_playlists_from_database()
-                playlists = [playlist for playlist in playlists 
-                           if playlist["folder_path"] != self.current_folder]
-                save_playlists_to_database(playlists)
+                # Extract original filename without order prefix
+                match = ORDER_PATTERN.match(filename)
+                original_name = match.group(2) if match else filename
                 
-                # Clear current folder and refresh UI
-                self.current_folder = None
-                self.folder_path.clear()
-                self.refresh_all_views()
-                self.statusBar().showMessage("Playlist deleted successfully")
+                # Get the new order
+                current_order = get_playlist_order(current_dir, song["id"])
+                new_order = self.changes.get(song["id"], current_order)
                 
-            except Exception as e:
-                QtWidgets.QMessageBox.critical(
-                    self,
-                    "Error",
-                    f"An error occurred while deleting the playlist: {str(e)}"
+                # Check if the song is disabled
+                is_disabled = new_order == -1 or (
+                    song["id"] not in self.changes and 
+                    current_order == -1
                 )
-                self.refresh_all_views()
+                
+                if is_disabled and not self.copy_to_new_dir:
+                    new_path = os.path.join(disabled_folder, filename)
+                    # Check if target path is writable
+                    if os.path.normcase(filename) in disabled_names:
+                        try:
+                            with open(new_path, 'ab'):
+                                pass
+                        except IOError:
+                            raise IOError(f"Cannot write to target path: {new_path}")
+                    file_operations.append(('move', old_path, new_path))
+                    song["path"] = new_path  # Update path in song dict
+                    db_changes.append((song, song.copy()))
+                elif not is_disabled:  # Only process enabled songs
+                    new_filename = f"{new_order:03d} {original_name}"
+                    
+                    if self.copy_to_new_dir:
+                        new_path = os.path.join(target_dir, new_filename)
+                        # Check if target path is writable
+                        if os.path.normcase(new_filename) in target_names:
+                            try:
+                                with open(new_path, 'ab'):
+                                    pass
+                            except IOError:
+                                raise IOError(f"Cannot write to target path: {new_path}")
+                        
+                        file_operations.append(('copy', old_path, new_path))
+                        
+                        # Generate new unique ID for this song
+                        new_id = next(free_ids, None)
+                        if new_id is None:
+                            raise ValueError("No available IDs left.")
+                        used_ids.add(new_id)
+                        
+                        new_song = {
+                            "id": new_id,
+                            "name": new_filename,
+                            "path": new_path,
+                            "series": song["series"],
+                            "weight": song["weight"]
+                        }
+                        new_db_entries.append((new_song, new_order))
+                    else:
+                        new_path = os.path.join(current_dir, new_filename)
+                        # Check if target path is writable
+                        if os.path.normcase(new_filename) in current_names:
+                            try:
+                                with open(new_path, 'ab'):
+                                    pass
+                            except IOError:
+                                raise IOError(f"Cannot write to target path: {new_path}")
+                        
+                        file_operations.append(('rename', old_path, new_path))
+                        song["path"] = new_path  # Update path in song dict
+                        song["name"] = new_filename  # Update name in song dict
+                        db_changes.append((song, song.copy()))
+        
+        # Second pass: Execute all operations
+        total_steps = len(file_operations) + len(db_changes) + len(new_db_entries)
+        try:
+            # Execute file operations
+            for done_steps, (operation, old_path, new_path) in enumerate(file_operations, 1):
+                if operation == 'move':
+                    shutil.move(old_path, new_path)
+                elif operation == 'copy':
+                    shutil.copyfile(old_path, new_path)  # Tags are rewritten next, so skip copying stat metadata
+                elif operation == 'rename':
+                    os.rename(old_path, new_path)
+                self.report_progress(done_steps, total_steps)
+
+            # Retitle every moved or copied file; new copies also get their ID.
+            # Tag writes are I/O bound, so run them in parallel.
+            id3_jobs = [
+                (song["path"], None) for song, original in db_changes
+                if os.path.exists(song["path"])  # Only update if file operation succeeded
+            ]
+            id3_jobs.extend((new_song["path"], new_song["id"]) for new_song, _ in new_db_entries)
+            total_steps = len(file_operations) + len(id3_jobs)
+            with ThreadPoolExecutor(max_workers=TAG_WORKERS) as executor:
+                for done_steps, _ in enumerate(executor.map(write_id3, id3_jobs), len(file_operations) + 1):
+                    self.report_progress(done_steps, total_steps)
+
+            # Collect the order updates and write the playlists database once.
+            # The songs in db_changes are entries of songs, already updated in place.
+            order_updates = []
+            if not self.copy_to_new_dir:
+                orders_by_id = get_playlist_orders(current_dir)
+                for song, original in db_changes:
+                    if os.path.exists(song["path"]):
+                        new_order = self.changes.get(
+                            song["id"], get_playlist_order(current_dir, song["id"], orders_by_id)
+                        )
+                        order_updates.append((current_dir, song["id"], new_order))
+
+            # Add new songs to the playlist
+            for new_song, new_order in new_db_entries:
+                order_updates.append((target_dir, new_song["id"], new_order))
+                new_songs.append(new_song)
+            update_playlist_orders_bulk(order_updates)
+            
+            # Update database
+            if new_songs:
+                songs.extend(new_songs)
+            save_songs_to_database(songs)
+            
+        except Exception as e:
+            # Rollback file operations
+            for operation, old_path, new_path in reversed(file_operations):
+                try:
+                    if operation == 'move' or operation == 'rename':
+                        if os.path.exists(new_path) and not os.path.exists(old_path):
+                            os.rename(new_path, old_path)
+                    elif operation == 'copy':
+                        if os.path.exists(new_path):
+                            os.remove(new_path)
+                except:
+                    pass  # Best effort rollback
+            
+            # Restore database to original state
+            original_songs = [original for _, original in db_changes]
+            save_songs_to_database(original_songs)
+            
+            raise Exception(f"Operation failed, changes rolled back: {str(e)}")
+
+
+class SongTableModel(QtCore.QAbstractTableModel):
+    """Read-only table model that serves song dicts straight from a list"""
+    HEADERS = []
+    FIELDS = []  # Song key shown in each column
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.songs = []
+        self.sort_column = None  # Keep the given order until sort() is called
+        self.sort_order = QtCore.Qt.AscendingOrder
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.songs)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def value(self, song, column):
+        """Return the raw value shown in the given column for a song"""
+        return song[self.FIELDS[column]]
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == QtCore.Qt.DisplayRole:
+            return self.value(self.songs[index.row()], index.column())
+        return None
+
+    def song_at(self, row):
+        return self.songs[row]
+
+    def set_songs(self, songs):
+        """Replace the rows, keeping the current sort"""
+        self.beginResetModel()
+        self.songs = list(songs)
+        self.sort_songs()
+        self.endResetModel()
+
+    def sort_songs(self):
+        column = self.sort_column
+        if column is None:
+            return
+        self.songs.sort(
+            key=lambda song: self.value(song, column),
+            reverse=self.sort_order == QtCore.Qt.DescendingOrder
+        )
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        self.sort_column = column
+        self.sort_order = order
+        self.layoutAboutToBeChanged.emit()
+        # Move persistent indexes (e.g. the selection) along with their songs
+        old_indexes = self.persistentIndexList()
+        old_ids = [self.songs[index.row()]["id"] for index in old_indexes]
+        self.sort_songs()
+        rows = {song["id"]: row for row, song in enumerate(self.songs)}
+        self.changePersistentIndexList(old_indexes, [
+            self.index(rows[song_id], index.column())
+            for index, song_id in zip(old_indexes, old_ids)
+        ])
+        self.layoutChanged.emit()
+
 
+class FolderSongsModel(SongTableModel):
+    """Songs of the current folder with their staged (preview) order"""
+    HEADERS = ["Current Order", "Preview Order", "ID", "Name", "Path", "Series", "Weight"]
+    FIELDS = [None, None, "id", "name", "path", "series", "weight"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.changes = {}
+        self.source = []  # Song list the rows were last built from
+        self.shown_previews = {}  # Song ID -> preview order currently displayed
+        self.disabled_brush = QtGui.QBrush(QtGui.QColor(245, 245, 245))  # Light gray background
+        self.changed_brush = QtGui.QBrush(QtGui.QColor(255, 255, 200))  # Light yellow background
+
+    def set_songs(self, songs, changes):
+        """
+        Show songs with the staged changes. When the songs are the same
+        objects as last time, only rows whose preview order changed are
+        repainted instead of resetting the whole model.
+        """
+        self.changes = changes
+        unchanged = len(songs) == len(self.source) and all(
+            a is b for a, b in zip(songs, self.source)
+        )
+        if not unchanged:
+            self.source = list(songs)
+            super().set_songs(songs)
+        else:
+            changed_rows = [
+                row for row, song in enumerate(self.songs)
+                if self.shown_previews.get(song["id"]) != self.preview_order(song)
+            ]
+            if changed_rows and self.sort_column == 1:
+                self.sort(self.sort_column, self.sort_order)
+            else:
+                last_column = self.columnCount() - 1
+                for row in changed_rows:
+                    self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+        self.shown_previews = {song["id"]: self.preview_order(song) for song in self.songs}
+
+    def preview_order(self, song):
+        return self.changes.get(song["id"], song.get("order", 0))
+
+    def value(self, song, column):
+        if column == 0:
+            return song.get("order", 0)
+        if column == 1:
+            return self.preview_order(song)
+        return super().value(song, column)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        song = self.songs[index.row()]
+        column = index.column()
+        if role == QtCore.Qt.DisplayRole:
+            if column == 1 and self.preview_order(song) == -1:
+                return "Disabled"
+            return self.value(song, column)
+        if role == QtCore.Qt.BackgroundRole:
+            preview_order = self.preview_order(song)
+            if preview_order == -1:
+                return self.disabled_brush
+            if column == 1 and preview_order != song.get("order", 0):
+                return self.changed_brush
+        return None
+
+
+class DisabledSongsModel(SongTableModel):
+    """Songs sitting in a playlist's Disabled folder"""
+    HEADERS = ["ID", "Name", "Path", "Series", "Weight", "Original Order"]
+    FIELDS = ["id", "name", "path", "series", "weight", "order"]
+
+
+class ApplyProgressDialog(QtWidgets.QProgressDialog):
+    """Progress dialog that cannot be dismissed while changes are applied"""
+    def reject(self):
+        pass  # Ignore Esc
+
+    def closeEvent(self, event):
+        event.ignore()
 
 class OrderTab(QtWidgets.QWidget):
     def __init__(self, parent=None):
@@ -789,13 +1330,13 @@ class OrderTab(QtWidgets.QWidget):
         layout.addLayout(controls_layout)
 
         # Table for showing songs
-        self.table = QtWidgets.QTableWidget()
-        self.table.setColumnCount(7)  # Added Preview Order column
-        self.table.setHorizontalHeaderLabels([
-            "Current Order", "Preview Order", "ID", "Name", "Path", "Series", "Weight"
-        ])
+        self.model = FolderSongsModel(self)
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self.model)
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        self.table.setSortingEnabled(True)
+        self.table.sortByColumn(0, QtCore.Qt.AscendingOrder)
         layout.addWidget(self.table)
 
         # Bottom controls for applying changes
@@ -829,62 +1370,21 @@ class OrderTab(QtWidgets.QWidget):
         if not self.parent.current_folder:
             return
 
-        self.table.setSortingEnabled(False)
-        self.table.clearContents()
-        
-        # Get songs with their order information
+        # The model reads the songs and staged changes directly; no per-cell items
         folder_songs = load_folder_songs(self.parent.current_folder)
-        
-        # Sort by order
-        folder_songs.sort(key=lambda x: x.get("order", 0))
-        
-        # Update table
-        self.table.setRowCount(len(folder_songs))
         self.order_spin.setMaximum(len(folder_songs))
-        
-        for row, song in enumerate(folder_songs):
-            current_order = song.get("order", 0)
-            preview_order = self.current_changes.get(song["id"], current_order)
-            
-            # Create items for all columns
-            order_item = QtWidgets.QTableWidgetItem()
-            order_item.setData(QtCore.Qt.DisplayRole, current_order)
-            
-            preview_item = QtWidgets.QTableWidgetItem()
-            id_item = QtWidgets.QTableWidgetItem(song["id"])
-            name_item = QtWidgets.QTableWidgetItem(song["name"])
-            path_item = QtWidgets.QTableWidgetItem(song["path"])
-            series_item = QtWidgets.QTableWidgetItem(song["series"])
-            weight_item = QtWidgets.QTableWidgetItem(str(song["weight"]))
-            
-            # Set items in table
-            self.table.setItem(row, 0, order_item)
-            self.table.setItem(row, 1, preview_item)
-            self.table.setItem(row, 2, id_item)
-            self.table.setItem(row, 3, name_item)
-            self.table.setItem(row, 4, path_item)
-            self.table.setItem(row, 5, series_item)
-            self.table.setItem(row, 6, weight_item)
-
-            # Handle display and styling for preview order
-            if preview_order == -1:  # Disabled status
-                preview_item.setData(QtCore.Qt.DisplayRole, "Disabled")
-                light_gray = QtGui.QColor(245, 245, 245)  # Light gray background
-                for col in range(7):
-                    self.table.item(row, col).setBackground(light_gray)
-            else:
-                preview_item.setData(QtCore.Qt.DisplayRole, preview_order)
-                if preview_order != current_order:
-                    light_yellow = QtGui.QColor(255, 255, 200)  # Light yellow background
-                    preview_item.setBackground(light_yellow)
-
-        self.table.setSortingEnabled(True)
+        self.model.set_songs(folder_songs, self.current_changes)
         self.apply_button.setEnabled(bool(self.current_changes))
         self.reset_button.setEnabled(bool(self.current_changes))
 
+    def selected_songs(self):
+        """Return the selected songs in view order"""
+        rows = sorted(index.row() for index in self.table.selectionModel().selectedRows())
+        return [self.model.song_at(row) for row in rows]
+
     def set_new_order(self):
-        selected_rows = sorted(set(item.row() for item in self.table.selectedItems()))
-        if not selected_rows:
+        selected = self.selected_songs()
+        if not selected:
             return
             
         new_order = self.order_spin.value()
@@ -892,7 +1392,8 @@ class OrderTab(QtWidgets.QWidget):
         total_songs = len(folder_songs)
         
         # Get selected song IDs
-        selected_song_ids = [self.table.item(row, 2).text() for row in selected_rows]
+        selected_song_ids = [song["id"] for song in selected]
+        selected_ids = frozenset(selected_song_ids)
         
         # First, preserve currently disabled songs
         disabled_songs = {
@@ -927,7 +1428,7 @@ class OrderTab(QtWidgets.QWidget):
         
         # Process all songs in order
         for song_id, _ in sorted_songs:
-            if song_id in selected_song_ids:
+            if song_id in selected_ids:
                 continue
             
             # Skip the range where selected songs will be placed
@@ -991,21 +1492,16 @@ class OrderTab(QtWidgets.QWidget):
 
         # Calculate target distribution for each series
         total_songs = len(songs)
+        last_position = total_songs - 1
         distribution_points = {}
         for series, series_songs in series_dict.items():
-            # Calculate roughly how many slots we want between each song
+            # Spread the series evenly over the playlist (integer math), with a
+            # small random shift on each point while roughly maintaining order
             series_size = len(series_songs)
             distribution_points[series] = [
-                int((i * total_songs) / series_size) 
+                min(max(i * total_songs // series_size + random.randint(-2, 2), 0), last_position)
                 for i in range(series_size)
             ]
-            # Add some randomness to the distribution points while maintaining order
-            for i in range(len(distribution_points[series])):
-                shift = random.randint(-2, 2)  # Small random shift
-                distribution_points[series][i] = max(0, min(
-                    total_songs - 1,
-                    distribution_points[series][i] + shift
-                ))
 
         # Shuffle songs within each series with weight-based distribution
         for series, series_songs in series_dict.items():
@@ -1029,7 +1525,8 @@ class OrderTab(QtWidgets.QWidget):
 
         # Initialize result list and tracking variables
         result = [None] * total_songs  # Pre-allocate list with None
-        used_positions = set()
+        series_at = [None] * total_songs  # Series of the song placed at each position
+        free_positions = list(range(total_songs))  # Sorted positions still empty
         series_index = {series: 0 for series in series_dict.keys()}
 
         # First pass: Place songs near their target positions
@@ -1040,37 +1537,54 @@ class OrderTab(QtWidgets.QWidget):
             for i, target in enumerate(target_points):
                 if i >= len(songs_to_place):
                     break
+                current_series = songs_to_place[i]['series']
+
+                # Look for the closest available position to the target: the
+                # target, then target + r and target - r for growing r. The
+                # search gives up at the first occupied position below the
+                # target; skipped songs are placed by the second pass.
+                # Only free positions are visited, found by bisecting.
+                target_index = bisect.bisect_left(free_positions, target)
+                if target_index == len(free_positions) or free_positions[target_index] != target:
+                    continue
+                candidate = target_index
+                above = target_index + 1
+                below = target_index - 1
+                while True:
+                    pos = free_positions[candidate]
+
+                    # Check if adjacent positions don't have same series
+                    if ((pos == 0 or series_at[pos-1] != current_series) and
+                        (pos == last_position or series_at[pos+1] != current_series)):
+                        result[pos] = songs_to_place[i]
+                        series_at[pos] = current_series
+                        del free_positions[candidate]
+                        break
 
-                # Look for the closest available position to the target
-                search_radius = 0
-                while search_radius < total_songs:
-                    for offset in [0, 1, -1]:  # Try target, then adjacent positions
-                        pos = target + (offset * search_radius)
-                        if 0 <= pos < total_songs and pos not in used_positions:
-                            # Check if adjacent positions don't have same series
-                            adjacent_clear = True
-                            for adj in [pos-1, pos+1]:
-                                if (0 <= adj < total_songs and 
-                                    result[adj] is not None and 
-                                    result[adj]['series'] == songs_to_place[i]['series']):
-                                    adjacent_clear = False
-                                    break
-
-                            if adjacent_clear:
-                                result[pos] = songs_to_place[i]
-                                used_positions.add(pos)
-                                break
-                    if pos in used_positions:  # If we placed a song, break the radius loop
+                    below_distance = target_index - below
+                    if target - below_distance < 0:
+                        below_distance = total_songs  # Nothing left below
+                    above_distance = (
+                        free_positions[above] - target
+                        if above < len(free_positions) else total_songs
+                    )
+                    if above_distance <= below_distance and above_distance < total_songs:
+                        candidate = above
+                        above += 1
+                    elif (below_distance < total_songs and
+                          free_positions[below] == target - below_distance):
+                        candidate = below
+                        below -= 1
+                    else:
                         break
-                    search_radius += 1
 
         # Second pass: Fill any remaining gaps
-        remaining_songs = []
-        for series, songs in series_dict.items():
-            remaining_songs.extend(
-                song for song in songs 
-                if song not in result
-            )
+        placed_ids = {song['id'] for song in result if song is not None}
+        remaining_songs = [
+            song for series_songs in series_dict.values()
+            for song in series_songs
+            if song['id'] not in placed_ids
+        ]
 
         # Shuffle remaining songs
         random.shuffle(remaining_songs)
@@ -1083,13 +1597,13 @@ class OrderTab(QtWidgets.QWidget):
                     adjacent_clear = True
                     for adj in [i-1, i+1]:
                         if (0 <= adj < total_songs and 
-                            result[adj] is not None and 
-                            result[adj]['series'] == song['series']):
+                            series_at[adj] == song['series']):
                             adjacent_clear = False
                             break
 
                     if adjacent_clear:
                         result[i] = song
+                        series_at[i] = song['series']
                         remaining_songs.pop(j)
                         break
 
@@ -1102,19 +1616,12 @@ class OrderTab(QtWidgets.QWidget):
 
     def enable_selected_songs(self):
         """Enable selected songs and assign them new order numbers at the end"""
-        selected_rows = sorted(set(item.row() for item in self.table.selectedItems()))
-        if not selected_rows:
+        selected = self.selected_songs()
+        if not selected:
             return
         
         # Get selected song IDs and their current preview orders
-        selected_songs = [
-            (self.table.item(row, 2).text(),  # ID
-            self.current_changes.get(
-                self.table.item(row, 2).text(),  # Get preview order
-                int(self.table.item(row, 0).text())  # Fallback to current order
-            ))
-            for row in selected_rows
-        ]
+        selected_songs = [(song["id"], self.model.preview_order(song)) for song in selected]
         
         # Filter out songs that are not disabled (preview order != -1)
         disabled_songs = [(song_id, order) for song_id, order in selected_songs if order == -1]
@@ -1139,14 +1646,12 @@ class OrderTab(QtWidgets.QWidget):
         self.refresh_view()
     
     def disable_selected_songs(self):
-        selected_rows = sorted(set(item.row() for item in self.table.selectedItems()))
-        if not selected_rows:
+        selected = self.selected_songs()
+        if not selected:
             return
         
         # Get selected song IDs and their current orders
-        selected_songs = [(self.table.item(row, 2).text(),  # ID
-                          int(self.table.item(row, 0).text()))  # Current order
-                         for row in selected_rows]
+        selected_songs = [(song["id"], song.get("order", 0)) for song in selected]
         
         # Mark selected songs as disabled in preview
         for song_id, _ in selected_songs:
@@ -1154,10 +1659,11 @@ class OrderTab(QtWidgets.QWidget):
         
         # Reorder remaining songs
         folder_songs = load_folder_songs(self.parent.current_folder)
+        selected_ids = frozenset(song_id for song_id, _ in selected_songs)
         current_pos = 1
         
         for song in folder_songs:
-            if song["id"] not in [s[0] for s in selected_songs]:
+            if song["id"] not in selected_ids:
                 if current_pos != song.get("order", 0):  # Only update if order changes
                     self.current_changes[song["id"]] = current_pos
                 current_pos += 1
@@ -1186,200 +1692,59 @@ class OrderTab(QtWidgets.QWidget):
                 os.makedirs(target_dir, exist_ok=True)
             else:
                 os.makedirs(disabled_folder, exist_ok=True)
-
-            # Load current state
-            songs = load_songs_from_database()
-            new_songs = []
-            used_ids = {s["id"] for s in songs}
-            
-            # Track all changes for potential rollback
-            file_operations = []  # List of (operation, old_path, new_path) tuples
-            db_changes = []  # List of (song_dict, original_state) tuples
-            new_db_entries = []  # List of new songs to be added
-            
-            # First pass: Validate all file operations are possible
-            for song in songs:
-                if os.path.dirname(song["path"]) == current_dir:
-                    old_path = song["path"]
-                    filename = os.path.basename(old_path)
-                    
-                    # Skip if file doesn't exist
-                    if not os.path.exists(old_path):
-                        raise FileNotFoundError(f"Source file not found: {old_path}")
-                    
-                    # Extract original filename without order prefix
-                    match = ORDER_PATTERN.match(filename)
-                    original_name = match.group(2) if match else filename
-                    
-                    # Get the new order
-                    current_order = get_playlist_order(current_dir, song["id"])
-                    new_order = self.current_changes.get(song["id"], current_order)
-                    
-                    # Check if the song is disabled
-                    is_disabled = new_order == -1 or (
-                        song["id"] not in self.current_changes and 
-                        current_order == -1
-                    )
-                    
-                    if is_disabled and not self.new_dir_radio.isChecked():
-                        new_path = os.path.join(disabled_folder, filename)
-                        # Check if target path is writable
-                        if os.path.exists(new_path):
-                            try:
-                                with open(new_path, 'ab'):
-                                    pass
-                            except IOError:
-                                raise IOError(f"Cannot write to target path: {new_path}")
-                        file_operations.append(('move', old_path, new_path))
-                        song["path"] = new_path  # Update path in song dict
-                        db_changes.append((song, song.copy()))
-                    elif not is_disabled:  # Only process enabled songs
-                        new_filename = f"{new_order:03d} {original_name}"
-                        
-                        if self.new_dir_radio.isChecked():
-                            new_path = os.path.join(target_dir, new_filename)
-                            # Check if target path is writable
-                            if os.path.exists(new_path):
-                                try:
-                                    with open(new_path, 'ab'):
-                                        pass
-                                except IOError:
-                                    raise IOError(f"Cannot write to target path: {new_path}")
-                            
-                            file_operations.append(('copy', old_path, new_path))
-                            
-                            # Generate new unique ID for this song
-                            new_id = None
-                            for i in range(10000):
-                                candidate_id = f"{ID_PREFIX}{i:04d}"
-                                if candidate_id not in used_ids:
-                                    new_id = candidate_id
-                                    used_ids.add(new_id)
-                                    break
-                            
-                            if new_id is None:
-                                raise ValueError("No available IDs left.")
-                            
-                            new_song = {
-                                "id": new_id,
-                                "name": new_filename,
-                                "path": new_path,
-                                "series": song["series"],
-                                "weight": song["weight"]
-                            }
-                            new_db_entries.append((new_song, new_order))
-                        else:
-                            new_path = os.path.join(current_dir, new_filename)
-                            # Check if target path is writable
-                            if os.path.exists(new_path):
-                                try:
-                                    with open(new_path, 'ab'):
-                                        pass
-                                except IOError:
-                                    raise IOError(f"Cannot write to target path: {new_path}")
-                            
-                            file_operations.append(('rename', old_path, new_path))
-                            song["path"] = new_path  # Update path in song dict
-                            song["name"] = new_filename  # Update name in song dict
-                            db_changes.append((song, song.copy()))
-            
-            # Second pass: Execute all operations
-            try:
-                # Execute file operations
-                for operation, old_path, new_path in file_operations:
-                    if operation == 'move':
-                        shutil.move(old_path, new_path)
-                    elif operation == 'copy':
-                        shutil.copy2(old_path, new_path)
-                    elif operation == 'rename':
-                        os.rename(old_path, new_path)
-                
-                # Update database entries and metadata
-                for song, original in db_changes:
-                    if os.path.exists(song["path"]):  # Only update if file operation succeeded
-                        # Update metadata
-                        try:
-                            audio = EasyID3(song["path"])
-                        except ID3NoHeaderError:
-                            audio = EasyID3()
-                            audio.save(song["path"])
-                        
-                        # Set title without extension and ensure it reflects new order
-                        title_with_order = os.path.splitext(os.path.basename(song["path"]))[0]
-                        audio['title'] = title_with_order
-                        audio.save()
-                        
-                        # Update order in database
-                        if not self.new_dir_radio.isChecked():
-                            new_order = self.current_changes.get(song["id"], get_playlist_order(current_dir, song["id"]))
-                            update_playlist_order(current_dir, song["id"], new_order)
-                            
-                            # Find and update the song in the main songs list
-                            for s in songs:
-                                if s["id"] == song["id"]:
-                                    s["path"] = song["path"]
-                                    s["name"] = song["name"]
-                                    break
-                
-                # Add new songs and update their metadata
-                for new_song, new_order in new_db_entries:
-                    add_id_to_metadata(new_song["path"], new_song["id"])
-                    try:
-                        audio = EasyID3(new_song["path"])
-                    except ID3NoHeaderError:
-                        audio = EasyID3()
-                        audio.save(new_song["path"])
-                    
-                    # Set title without extension
-                    title_with_order = os.path.splitext(os.path.basename(new_song["path"]))[0]
-                    audio['title'] = title_with_order
-                    audio.save()
-                    
-                    # Update order for the new song
-                    update_playlist_order(target_dir, new_song["id"], new_order)
-                    new_songs.append(new_song)
-                
-                # Update database
-                if new_songs:
-                    songs.extend(new_songs)
-                save_songs_to_database(songs)
-                
-            except Exception as e:
-                # Rollback file operations
-                for operation, old_path, new_path in reversed(file_operations):
-                    try:
-                        if operation == 'move' or operation == 'rename':
-                            if os.path.exists(new_path) and not os.path.exists(old_path):
-                                os.rename(new_path, old_path)
-                        elif operation == 'copy':
-                            if os.path.exists(new_path):
-                                os.remove(new_path)
-                    except:
-                        pass  # Best effort rollback
-                
-                # Restore database to original state
-                original_songs = [original for _, original in db_changes]
-                save_songs_to_database(original_songs)
-                
-                raise Exception(f"Operation failed, changes rolled back: {str(e)}")
-            
-            # If new directory was created, switch to it
-            if self.new_dir_radio.isChecked():
-                self.parent.current_folder = target_dir
-                self.parent.folder_path.setText(target_dir)
-            
-            # Reset changes and refresh views
-            self.current_changes.clear()
-            self.parent.refresh_all_views()
-            self.parent.statusBar().showMessage("Order changes applied successfully")
-            
         except Exception as e:
-            QtWidgets.QMessageBox.critical(
-                self, "Error",
-                f"An error occurred while applying changes: {str(e)}"
-            )
-            self.parent.refresh_all_views()
+            self.on_apply_failed(str(e))
+            return
 
+        # Move, copy and retag the files on a worker thread, showing its progress
+        self.progress_dialog = ApplyProgressDialog(
+            "Applying order changes...", None, 0, 100, self
+        )
+        self.progress_dialog.setWindowTitle("Apply Changes")
+        self.progress_dialog.setWindowModality(QtCore.Qt.WindowModal)
+        self.progress_dialog.setMinimumDuration(0)
+        self.progress_dialog.setValue(0)
+        # Keep the whole window blocked until the worker reports back, so no
+        # changes are staged or saved while it works on the databases
+        self.parent.centralWidget().setEnabled(False)
+
+        worker = ApplyChangesWorker(
+            current_dir, target_dir, dict(self.current_changes), self.new_dir_radio.isChecked()
+        )
+        worker.signals.progress.connect(self.progress_dialog.setValue, QtCore.Qt.QueuedConnection)
+        worker.signals.finished.connect(self.on_changes_applied, QtCore.Qt.QueuedConnection)
+        worker.signals.error.connect(self.on_apply_failed, QtCore.Qt.QueuedConnection)
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    def close_progress_dialog(self):
+        """Hide and dispose of the progress dialog of the last apply, if any"""
+        if getattr(self, "progress_dialog", None) is not None:
+            self.progress_dialog.hide()
+            self.progress_dialog.deleteLater()
+            self.progress_dialog = None
+
+    def on_changes_applied(self, target_dir):
+        self.close_progress_dialog()
+        self.parent.centralWidget().setEnabled(True)
+
+        # If new directory was created, switch to it
+        if target_dir != self.parent.current_folder:
+            self.parent.current_folder = target_dir
+            self.parent.folder_path.setText(target_dir)
+        
+        # Reset changes and refresh views
+        self.current_changes.clear()
+        self.parent.refresh_all_views()
+        self.parent.statusBar().showMessage("Order changes applied successfully")
+
+    def on_apply_failed(self, message):
+        self.close_progress_dialog()
+        self.parent.centralWidget().setEnabled(True)
+        QtWidgets.QMessageBox.critical(
+            self, "Error",
+            f"An error occurred while applying changes: {message}"
+        )
+        self.parent.refresh_all_views()
 
 class DisabledTab(QtWidgets.QWidget):
     def __init__(self, parent=None):
@@ -1391,11 +1756,9 @@ class DisabledTab(QtWidgets.QWidget):
         layout = QtWidgets.QVBoxLayout(self)
         
         # Table for showing disabled songs
-        self.table = QtWidgets.QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels([
-            "ID", "Name", "Path", "Series", "Weight", "Original Order"
-        ])
+        self.model = DisabledSongsModel(self)
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self.model)
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
         layout.addWidget(self.table)
@@ -1410,31 +1773,21 @@ class DisabledTab(QtWidgets.QWidget):
             return
             
         disabled_folder = os.path.join(self.parent.current_folder, "Disabled")
-        if not os.path.exists(disabled_folder):
-            self.table.setRowCount(0)
+        disabled_filenames = list_file_names(disabled_folder)
+        if not disabled_filenames:
+            self.model.set_songs([])
             return
             
-        # Get disabled songs
-        songs = load_songs_from_database()
-        disabled_songs = [
-            song for song in songs 
-            if os.path.dirname(song["path"]) == disabled_folder
-        ]
-        
-        self.table.setRowCount(len(disabled_songs))
-        for row, song in enumerate(disabled_songs):
-            self.table.setItem(row, 0, QtWidgets.QTableWidgetItem(song["id"]))
-            self.table.setItem(row, 1, QtWidgets.QTableWidgetItem(song["name"]))
-            self.table.setItem(row, 2, QtWidgets.QTableWidgetItem(song["path"]))
-            self.table.setItem(row, 3, QtWidgets.QTableWidgetItem(song["series"]))
-            self.table.setItem(row, 4, QtWidgets.QTableWidgetItem(str(song["weight"])))
-            
-            # Get original order if available
-            original_order = get_playlist_order(disabled_folder, song["id"])
-            self.table.setItem(row, 5, QtWidgets.QTableWidgetItem(str(original_order)))
+        # Get disabled songs whose files are still there, with their original order
+        orders_by_id = get_playlist_orders(disabled_folder)
+        self.model.set_songs(
+            dict(song, order=get_playlist_order(disabled_folder, song["id"], orders_by_id))
+            for song in get_songs_by_dir().get(disabled_folder, ())
+            if os.path.basename(song["path"]) in disabled_filenames
+        )
 
     def enable_selected_songs(self):
-        selected_rows = sorted(set(item.row() for item in self.table.selectedItems()))
+        selected_rows = sorted(index.row() for index in self.table.selectionModel().selectedRows())
         if not selected_rows:
             return
             
@@ -1444,26 +1797,20 @@ class DisabledTab(QtWidgets.QWidget):
             disabled_folder = os.path.join(current_dir, "Disabled")
             
             # Get current max order from active (non-disabled) songs
-            current_max_order = 0
-            playlists = load_playlists_from_database()
-            playlist_entry = next(
-                (p for p in playlists if p["folder_path"] == current_dir),
-                None
+            orders_by_id = get_playlist_orders(current_dir)
+            # Only consider orders of songs that are not in the Disabled folder
+            current_max_order = max(
+                (orders_by_id[s["id"]] for s in get_songs_by_dir().get(current_dir, ())
+                if s["id"] in orders_by_id),
+                default=0
             )
-            if playlist_entry:
-                # Only consider orders of songs that are not in the Disabled folder
-                active_song_ids = {s["id"] for s in songs 
-                                if os.path.dirname(s["path"]) == current_dir}
-                current_max_order = max(
-                    (o["order"] for o in playlist_entry["orders"]
-                    if o["id"] in active_song_ids),
-                    default=0
-                )
             
             # Process each selected song
+            order_updates = []
+            songs_by_id = {s["id"]: s for s in songs}
             for row in selected_rows:
-                song_id = self.table.item(row, 0).text()
-                song = next((s for s in songs if s["id"] == song_id), None)
+                song_id = self.model.song_at(row)["id"]
+                song = songs_by_id.get(song_id)
                 
                 if song:
                     # Move file back to main folder
@@ -1471,19 +1818,21 @@ class DisabledTab(QtWidgets.QWidget):
                     filename = os.path.basename(old_path)
                     new_path = os.path.join(current_dir, filename)
                     
-                    # Use shutil.move and handle file removal
-                    if os.path.exists(old_path):
+                    # A file that is already gone only needs its database entry fixed
+                    try:
                         shutil.move(old_path, new_path)
-                        # If original file still exists after move, delete it
+                    except FileNotFoundError:
+                        # Only a missing source is fine; a missing destination is an error
                         if os.path.exists(old_path):
-                            os.remove(old_path)
+                            raise
                     
                     song["path"] = new_path
                     
                     # Assign new order (next number after current max)
                     current_max_order += 1
-                    update_playlist_order(current_dir, song_id, current_max_order)
+                    order_updates.append((current_dir, song_id, current_max_order))
             
+            update_playlist_orders_bulk(order_updates)
             save_songs_to_database(songs)
             self.parent.refresh_all_views()
             self.parent.statusBar().showMessage("Selected songs enabled successfully")
@@ -1502,126 +1851,419 @@ def extract_order_number(filename):
     Expected format: '###_filename' or '### filename'
     Returns 0 if no order number is found.
     """
-    ORDER_PATTERN = re.compile(r'^(\d{3})\s+(.+)$')
     match = ORDER_PATTERN.match(filename)
     if match:
         return int(match.group(1))
     return 0
 
+def list_file_names(folder_path):
+    """Return the names of the files directly in a folder, or an empty set if it is missing"""
+    try:
+        with os.scandir(folder_path) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
 def initialize_database():
     """Initialize both database files if they don't exist"""
-    if not os.path.exists(SONGS_DATABASE):
-        with open(SONGS_DATABASE, "w") as db_file:
-            json.dump([], db_file)
-    
-    if not os.path.exists(PLAYLISTS_DATABASE):
-        with open(PLAYLISTS_DATABASE, "w") as db_file:
-            json.dump([], db_file)
+    for path in (SONGS_DATABASE, PLAYLISTS_DATABASE):
+        if not os.path.exists(path):
+            write_database(path, [])
+
+def database_version(path):
+    """Return the (mtime_ns, size) of a database file, or None if it is missing"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+def write_database(path, data, snapshot=None):
+    """
+    Serialize a database to disk, using orjson when it is available. The
+    file is replaced atomically, and not rewritten at all when the content
+    is unchanged since our last write. When given, snapshot (a private copy
+    of data) becomes the cached content, so the next read skips parsing.
+    Inside db_transaction the write is only recorded until the block ends.
+    """
+    pending = getattr(_transaction, "pending", None)
+    if pending is not None:
+        # Later reads in the transaction see the snapshot; it is what gets written
+        with _database_lock:
+            pending[path] = data if snapshot is None else snapshot
+            forget_derived(path, pending[path])
+        return
+    with _database_lock:
+        _write_database(path, data, snapshot)
+
+def _write_database(path, data, snapshot):
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    else:
+        payload = json.dumps(data, separators=(",", ":")).encode("utf-8") + b"\n"
+
+    digest = hashlib.blake2b(payload).digest()
+    if _database_digests.get(path) == (digest, database_version(path)):
+        return
+
+    tmp_file = tempfile.NamedTemporaryFile(
+        "wb", dir=os.path.dirname(os.path.abspath(path)),
+        prefix=os.path.basename(path) + ".", suffix=".tmp", delete=False
+    )
+    try:
+        with tmp_file:
+            tmp_file.write(payload)
+            # Make sure the new content is on disk before it replaces the old file
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_file.name, path)
+    except Exception:
+        if os.path.exists(tmp_file.name):
+            os.remove(tmp_file.name)
+        raise
+    version = database_version(path)
+    if snapshot is None:
+        _database_cache.pop(path, None)
+    else:
+        _database_cache[path] = (version, snapshot)
+    _database_digests[path] = (digest, version)
+    forget_derived(path, snapshot)
+
+@contextmanager
+def db_transaction():
+    """
+    Defer database saves made by this thread inside the block, writing each
+    database at most once when the outermost block exits.
+    """
+    if getattr(_transaction, "pending", None) is not None:
+        yield  # Nested: the outer transaction writes
+        return
+    _transaction.pending = {}
+    try:
+        yield
+    finally:
+        pending = _transaction.pending
+        _transaction.pending = None
+        for path, data in pending.items():
+            write_database(path, data, data)
+
+def read_database(path):
+    """
+    Return the parsed database at path, re-reading the file (with orjson
+    when available) only when its modification time or size changed. The
+    returned object is shared between callers and must not be modified.
+    """
+    pending = getattr(_transaction, "pending", None)
+    if pending is not None and path in pending:
+        return pending[path]
+    version = database_version(path)
+    if version is None:
+        raise FileNotFoundError(f"Database not found: {path}")
+    with _database_lock:
+        cached = _database_cache.get(path)
+        if cached is None or cached[0] != version:
+            if orjson is not None:
+                with open(path, "rb") as db_file:
+                    cached = (version, orjson.loads(db_file.read()))
+            else:
+                with open(path, "r", encoding="utf-8") as db_file:
+                    cached = (version, json.load(db_file))
+            _database_cache[path] = cached
+            forget_derived(path, cached[1])
+        return cached[1]
+
+def get_derived(name, build, *paths):
+    """Return build(*databases), recomputed only when one of the databases changed"""
+    with _database_lock:
+        sources = tuple(read_database(path) for path in paths)
+        cached = _derived_cache.get(name)
+        if cached is None or any(a is not b for a, b in zip(cached[1], sources)):
+            cached = (paths, sources, build(*sources))
+            _derived_cache[name] = cached
+        return cached[2]
+
+def forget_derived(path, current):
+    """Drop derived data built from a database at path other than current"""
+    with _database_lock:
+        for name, (paths, sources, _) in list(_derived_cache.items()):
+            if any(p == path and s is not current for p, s in zip(paths, sources)):
+                del _derived_cache[name]
 
 def load_songs_from_database():
     """Load song metadata from the main database"""
-    with open(SONGS_DATABASE, "r") as db_file:
-        return json.load(db_file)
+    # Copy the entries so callers can modify them freely
+    return [dict(song) for song in read_database(SONGS_DATABASE)]
+
+def save_songs_to_database(songs, added=(), removed=()):
+    """
+    Save song metadata to the main database. A caller whose only change
+    since loading the songs was appending the added songs or dropping the
+    removed ones passes them, so the cached song indexes are updated in
+    place instead of being rebuilt from the saved database.
+    """
+    snapshot = [dict(song) for song in songs]
+    if not added and not removed:
+        write_database(SONGS_DATABASE, songs, snapshot)
+        return
+    with _database_lock:
+        previous = read_database(SONGS_DATABASE)
+        kept = {}
+        for name in ("paths", "songs_by_id", "id_allocator"):
+            cached = _derived_cache.get(name)
+            if cached is not None and cached[1][0] is previous:
+                kept[name] = cached[2]
+        write_database(SONGS_DATABASE, songs, snapshot)
+        saved = read_database(SONGS_DATABASE)
+        if saved is previous:
+            return  # Nothing was written, so the indexes still hold
+        added = snapshot[len(snapshot) - len(added):]
+        for name, key in (("paths", "path"), ("songs_by_id", "id")):
+            if name in kept:
+                index = kept[name]
+                for song in removed:
+                    index.pop(song[key], None)
+                index.update((song[key], song) for song in added)
+        if "id_allocator" in kept:
+            kept["id_allocator"] = update_id_allocator(kept["id_allocator"], added, removed)
+        for name, value in kept.items():
+            _derived_cache[name] = ((SONGS_DATABASE,), (saved,), value)
+
+def get_registered_paths():
+    """Return an index of registered song paths, rebuilt when the database changes"""
+    return get_derived(
+        "paths",
+        lambda songs: {song["path"]: song for song in songs},
+        SONGS_DATABASE
+    )
+
+def group_songs_by_dir(songs):
+    """Map each directory to the songs whose files live directly in it"""
+    songs_by_dir = defaultdict(list)
+    for song in songs:
+        songs_by_dir[os.path.dirname(song["path"])].append(song)
+    return dict(songs_by_dir)
 
-def save_songs_to_database(songs):
-    """Save song metadata to the main database"""
-    with open(SONGS_DATABASE, "w") as db_file:
-        json.dump(songs, db_file, indent=4)
+def get_songs_by_dir():
+    """
+    Return the directory -> songs index, rebuilt when the songs database
+    changes. The index and its songs are shared and must not be modified.
+    """
+    return get_derived("songs_by_dir", group_songs_by_dir, SONGS_DATABASE)
+
+def get_songs_by_id():
+    """
+    Return the song ID -> song index, rebuilt when the songs database
+    changes. The index and its songs are shared and must not be modified.
+    """
+    return get_derived(
+        "songs_by_id",
+        lambda songs: {song["id"]: song for song in songs},
+        SONGS_DATABASE
+    )
+
+def index_playlists(playlists):
+    """Map folder path -> playlist entry; the first entry for a folder wins"""
+    playlists_by_folder = {}
+    for playlist in playlists:
+        playlists_by_folder.setdefault(playlist["folder_path"], playlist)
+    return playlists_by_folder
+
+def get_playlists_by_folder():
+    """
+    Return the folder path -> playlist entry index, rebuilt when the
+    playlists database changes. The entries are shared and must not be modified.
+    """
+    return get_derived("playlists_by_folder", index_playlists, PLAYLISTS_DATABASE)
 
 def load_playlists_from_database():
     """Load playlist order information"""
-    with open(PLAYLISTS_DATABASE, "r") as db_file:
-        return json.load(db_file)
+    # Copy the entries so callers can modify them freely
+    return [
+        dict(playlist, orders=[dict(o) for o in playlist["orders"]])
+        for playlist in read_database(PLAYLISTS_DATABASE)
+    ]
 
 def save_playlists_to_database(playlists):
     """Save playlist order information"""
-    with open(PLAYLISTS_DATABASE, "w") as db_file:
-        json.dump(playlists, db_file, indent=4)
+    write_database(
+        PLAYLISTS_DATABASE, playlists,
+        [dict(playlist, orders=[dict(o) for o in playlist["orders"]]) for playlist in playlists]
+    )
 
-def get_playlist_order(folder_path, song_id):
-    """Get the order of a song in a specific folder"""
-    playlists = load_playlists_from_database()
+def build_playlist_orders(folder_path, playlists):
+    """Map song ID -> order for a folder; the first entry for an ID wins"""
+    orders_by_id = {}
     for playlist in playlists:
         if playlist["folder_path"] == folder_path:
             for order_entry in playlist["orders"]:
-                if order_entry["id"] == song_id:
-                    return order_entry["order"]
-    return 0
+                orders_by_id.setdefault(order_entry["id"], order_entry["order"])
+    return orders_by_id
+
+def get_playlist_orders(folder_path):
+    """
+    Return the song ID -> order index of a folder, rebuilt when the
+    playlists database changes. The index is shared and must not be modified.
+    """
+    return get_derived(
+        ("orders", folder_path),
+        lambda playlists: build_playlist_orders(folder_path, playlists),
+        PLAYLISTS_DATABASE
+    )
+
+def get_playlist_order(folder_path, song_id, orders_by_id=None):
+    """Get the order of a song in a specific folder, optionally from a prebuilt index"""
+    if orders_by_id is None:
+        orders_by_id = get_playlist_orders(folder_path)
+    return orders_by_id.get(song_id, 0)
+
+def index_orders(playlist_entry):
+    """
+    Map song ID -> order entry of a playlist entry; the first entry for an ID
+    wins. The index is kept beside the entry so it never reaches the JSON.
+    """
+    orders_by_id = {}
+    for order_entry in playlist_entry["orders"]:
+        orders_by_id.setdefault(order_entry["id"], order_entry)
+    return orders_by_id
 
 def update_playlist_order(folder_path, song_id, new_order):
     """Update or add a song's order in a playlist"""
+    update_playlist_orders_bulk([(folder_path, song_id, new_order)])
+
+def update_playlist_orders_bulk(updates):
+    """
+    Update or add several song orders, given as (folder_path, song_id,
+    new_order) tuples, loading and saving the playlists database once.
+    """
+    updates = list(updates)
+    if not updates:
+        return
     playlists = load_playlists_from_database()
-    
-    # Find or create playlist entry
-    playlist_entry = next(
-        (p for p in playlists if p["folder_path"] == folder_path),
-        None
-    )
-    
-    if playlist_entry is None:
-        playlist_entry = {
-            "folder_path": folder_path,
-            "orders": []
-        }
-        playlists.append(playlist_entry)
-    
-    # Update or add order
-    order_entry = next(
-        (o for o in playlist_entry["orders"] if o["id"] == song_id),
-        None
-    )
-    
-    if order_entry:
-        order_entry["order"] = new_order
-    else:
-        playlist_entry["orders"].append({
-            "id": song_id,
-            "order": new_order
-        })
-    
+    apply_playlist_order_updates(playlists, updates)
     save_playlists_to_database(playlists)
 
+def apply_playlist_order_updates(playlists, updates):
+    """
+    Apply (folder_path, song_id, new_order) updates to an already loaded
+    playlists list in place, adding playlist and order entries as needed
+    """
+    playlists_by_folder = index_playlists(playlists)
+    entries_by_folder = {}
+    
+    for folder_path, song_id, new_order in updates:
+        # Find or create playlist entry, indexing its orders by song ID
+        if folder_path not in entries_by_folder:
+            playlist_entry = playlists_by_folder.get(folder_path)
+            if playlist_entry is None:
+                playlist_entry = {
+                    "folder_path": folder_path,
+                    "orders": []
+                }
+                playlists.append(playlist_entry)
+            entries_by_folder[folder_path] = (playlist_entry, index_orders(playlist_entry))
+        playlist_entry, orders_by_id = entries_by_folder[folder_path]
+        
+        # Update or add order
+        order_entry = orders_by_id.get(song_id)
+        if order_entry:
+            order_entry["order"] = new_order
+        else:
+            order_entry = {
+                "id": song_id,
+                "order": new_order
+            }
+            playlist_entry["orders"].append(order_entry)
+            orders_by_id[song_id] = order_entry
+
+def build_id_allocator(songs):
+    """
+    Return (free numbers below the counter in ascending order, counter) for
+    the song IDs in use, where the counter is one past the highest ID number
+    """
+    used_numbers = {id_number(song["id"]) for song in songs}
+    used_numbers.discard(None)
+    counter = max(used_numbers, default=-1) + 1
+    return [i for i in range(counter) if i not in used_numbers], counter
+
+def id_number(song_id):
+    """Return the number of a song ID in the generated form, else None"""
+    # Only IDs in the generated form can collide with a generated one
+    number = song_id[len(ID_PREFIX):]
+    if song_id.startswith(ID_PREFIX) and number.isdigit():
+        if song_id == f"{ID_PREFIX}{int(number):04d}":
+            return int(number)
+    return None
+
+def update_id_allocator(allocator, added, removed):
+    """Return the ID allocator after the added songs were saved and the removed ones dropped"""
+    free_numbers, counter = allocator
+    for song in removed:
+        number = id_number(song["id"])
+        if number is not None:
+            bisect.insort(free_numbers, number)
+    for song in added:
+        number = id_number(song["id"])
+        if number is None:
+            continue
+        if number >= counter:
+            free_numbers.extend(range(counter, number))
+            counter = number + 1
+        else:
+            position = bisect.bisect_left(free_numbers, number)
+            if position < len(free_numbers) and free_numbers[position] == number:
+                del free_numbers[position]
+    return free_numbers, counter
+
 def generate_song_id():
-    songs = load_songs_from_database()
-    used_ids = {song["id"] for song in songs}
-    for i in range(10000):
-        candidate_id = f"{ID_PREFIX}{i:04d}"
-        if candidate_id not in used_ids:
-            return candidate_id
-    raise ValueError("No available IDs left.")
-
-def find_next_available_order(songs, folder_path, current_max_order):
+    """Return the lowest unused song ID"""
+    free_numbers, counter = get_derived("id_allocator", build_id_allocator, SONGS_DATABASE)
+    number = free_numbers[0] if free_numbers else counter
+    if number >= 10000:
+        raise ValueError("No available IDs left.")
+    return f"{ID_PREFIX}{number:04d}"
+
+def build_order_mask(songs):
+    """Return a bitset (as an int) with bit n set for each order number n used by the songs"""
+    mask = 0
+    for song in songs:
+        mask |= 1 << extract_order_number(song["name"])
+    return mask
+
+def find_next_available_order(folder_path, current_max_order):
     """
     Find the next available order number in a sequence, filling any gaps.
     Returns the next available number.
     """
-    # Get all order numbers in the folder
-    folder_songs = [song for song in songs if os.path.dirname(song["path"]) == folder_path]
-    used_numbers = set(extract_order_number(song["name"]) for song in folder_songs)
+    # Bitset of the order numbers used in the folder, cached until the songs change
+    used_mask = get_derived(
+        ("order_mask", folder_path),
+        lambda *_: build_order_mask(get_songs_by_dir().get(folder_path, ())),
+        SONGS_DATABASE
+    )
     
-    # Start from 1 and find the first available number
-    for i in range(1, current_max_order + 2):  # +2 to also check one number after max
-        if i not in used_numbers:
-            return i
+    # Lowest unused number from 1 to one after max
+    window = (1 << max(current_max_order + 2, 1)) - 2
+    gaps = ~used_mask & window
+    if gaps:
+        return (gaps & -gaps).bit_length() - 1
     
     # If no gaps found, return next number after max
     return current_max_order + 1
 
 def add_song_to_database(file_path):
     """Add a song to the database and its metadata."""
+    from mutagen.easyid3 import EasyID3
+    from mutagen.id3 import ID3NoHeaderError
+
     try:
-        songs = load_songs_from_database()
-        if not any(song["path"] == file_path for song in songs):
+        if file_path not in get_registered_paths():
             new_id = generate_song_id()
             current_folder = os.path.dirname(file_path)
             
             # Get current max order number for the folder
             current_max_order = 0
             playlists = load_playlists_from_database()
-            playlist_entry = next(
-                (p for p in playlists if p["folder_path"] == current_folder),
-                None
-            )
+            playlist_entry = index_playlists(playlists).get(current_folder)
             
             if playlist_entry:
                 current_max_order = max(
@@ -1645,6 +2287,7 @@ def add_song_to_database(file_path):
                     audio.save(file_path)
                 
                 # Add to songs database
+                songs = load_songs_from_database()
                 new_song = {
                     "id": new_id,
                     "name": original_name,
@@ -1653,10 +2296,11 @@ def add_song_to_database(file_path):
                     "weight": 2
                 }
                 songs.append(new_song)
-                save_songs_to_database(songs)
+                save_songs_to_database(songs, added=[new_song])
                 
-                # Add to playlists database
-                update_playlist_order(current_folder, new_id, new_order)
+                # Add to playlists database, reusing the list loaded above
+                apply_playlist_order_updates(playlists, [(current_folder, new_id, new_order)])
+                save_playlists_to_database(playlists)
                 return True
         return False
     except Exception as e:
@@ -1664,33 +2308,35 @@ def add_song_to_database(file_path):
         return False
 
 def load_folder_songs(folder_path):
-    """Load songs for a specific folder with their order information"""
-    songs = load_songs_from_database()
-    folder_songs = [
-        song for song in songs 
-        if os.path.dirname(song["path"]) == folder_path
-    ]
-    
-    # Add order information from playlists database
-    playlists = load_playlists_from_database()
-    playlist_entry = next(
-        (p for p in playlists if p["folder_path"] == folder_path),
-        None
-    )
-    
-    if playlist_entry:
-        for song in folder_songs:
-            order_entry = next(
-                (o for o in playlist_entry["orders"] if o["id"] == song["id"]),
-                None
-            )
-            song["order"] = order_entry["order"] if order_entry else 0
-    else:
+    """
+    Load songs for a specific folder with their order information.
+    The result is cached until either database changes, so the song
+    entries are shared and must not be modified.
+    """
+    return list(get_derived(
+        ("folder_songs", folder_path),
+        lambda *_: build_folder_songs(
+            get_songs_by_dir().get(folder_path, ()),
+            get_playlists_by_folder().get(folder_path)
+        ),
+        SONGS_DATABASE, PLAYLISTS_DATABASE
+    ))
+
+def build_folder_songs(songs, playlist_entry):
+    """Build the entries of a folder's songs, with orders from its playlist entry"""
+    # Each entry is a new dict with the order stamped on it, so the cached
+    # database songs themselves never carry an order
+    if not playlist_entry:
         # If no playlist entry exists, assign sequential orders
-        for i, song in enumerate(folder_songs, 1):
-            song["order"] = i
-    
-    return folder_songs
+        return [dict(song, order=i) for i, song in enumerate(songs, 1)]
+
+    # Add order information from playlists database
+    orders_by_id = index_orders(playlist_entry)
+    no_entry = {"order": 0}
+    return [
+        dict(song, order=orders_by_id.get(song["id"], no_entry)["order"])
+        for song in songs
+    ]
 
 def apply_order_changes(current_folder, changes, target_folder=None):
     """Apply order changes to a folder"""
@@ -1713,28 +2359,35 @@ def apply_order_changes(current_folder, changes, target_folder=None):
         playlists.append(target_playlist)
     
     # Update orders
+    orders_by_id = index_orders(target_playlist)
     for song_id, new_order in changes.items():
-        order_entry = next(
-            (o for o in target_playlist["orders"] if o["id"] == song_id),
-            None
-        )
+        order_entry = orders_by_id.get(song_id)
         
         if order_entry:
             order_entry["order"] = new_order
         else:
-            target_playlist["orders"].append({
+            order_entry = {
                 "id": song_id,
                 "order": new_order
-            })
+            }
+            target_playlist["orders"].append(order_entry)
+            orders_by_id[song_id] = order_entry
     
     save_playlists_to_database(playlists)
 
 def remove_song_from_database(song_id, folder_path):
     """Remove a song from both databases"""
+    remove_songs_from_database([song_id], folder_path)
+
+def remove_songs_from_database(song_ids, folder_path):
+    """Remove several songs from both databases, saving each database once"""
+    song_ids = set(song_ids)
+
     # Remove from songs database
     songs = load_songs_from_database()
-    songs = [song for song in songs if song["id"] != song_id]
-    save_songs_to_database(songs)
+    removed = [song for song in songs if song["id"] in song_ids]
+    songs = [song for song in songs if song["id"] not in song_ids]
+    save_songs_to_database(songs, removed=removed)
     
     # Remove from playlists database
     playlists = load_playlists_from_database()
@@ -1742,7 +2395,7 @@ def remove_song_from_database(song_id, folder_path):
         if playlist["folder_path"] == folder_path:
             playlist["orders"] = [
                 o for o in playlist["orders"] 
-                if o["id"] != song_id
+                if o["id"] not in song_ids
             ]
     
     save_playlists_to_database(playlists)
@@ -1750,6 +2403,10 @@ def remove_song_from_database(song_id, folder_path):
 def main():
     initialize_database()
     app = QtWidgets.QApplication([])
+    # Leave a core free for the GUI thread when workers run
+    QtCore.QThreadPool.globalInstance().setMaxThreadCount(
+        max(1, QtCore.QThread.idealThreadCount() - 1)
+    )
     window = PlaylistManagerUI()
     window.show()
     app.exec_()